@@ -7,6 +7,7 @@ import asyncio
 
 # First party imports
 from .errors import *
+from .player import *
 from .utils import *
 
 # Third-party imports
@@ -44,7 +45,7 @@ class LavalinkVoiceClient(discord.VoiceClient):
         if hasattr(self.client, "lavalink"):
             self.lavalink = self.client.lavalink
         else:
-            self.client.lavalink = lavalink.Client(client.user.id)
+            self.client.lavalink = lavalink.Client(client.user.id, player=FairPlayer)
             self.client.lavalink.add_node(
                 host="localhost",
                 port=2333,
@@ -141,7 +142,7 @@ async def on_ready():
 
     # Checks if client already has a Lavalink client and create ones if it doesn't
     if not hasattr(client, "lavalink"):
-        client.lavalink = lavalink.Client(client.user.id)
+        client.lavalink = lavalink.Client(client.user.id, player=FairPlayer)
         client.lavalink.add_node(
             host="localhost",
             port=2333,
@@ -437,7 +438,7 @@ async def skip(interaction: discord.Interaction, amount: int = 1):
     """
     player = get_player(interaction)
 
-    if len(player.queue) <= 0:
+    if not player.has_pending:
         return await interaction.response.send_message("Unable to skip track, queue is currently empty")
 
     if amount <= 0:
@@ -604,12 +605,19 @@ async def queue(interaction: discord.Interaction, page: int = 1):
                             inline=False)
 
     
-    embed.set_footer(text=f"Page {page} out of {pages}")
+    footer = f"Page {page} out of {pages}"
+    if player.fair_queue and player.shuffle:
+        footer += " | Shuffling: each user's next track is picked at random"
+    embed.set_footer(text=footer)
     await interaction.response.send_message(embed=embed)
 
 @client.tree.command()
 async def shuffle(interaction: discord.Interaction):
-    """Shuffles the current queue
+    """Shuffles the current queue, or toggles shuffling when fair queue is on
+
+    When fair queue is on, running it again turns shuffling back off. While it's on
+    each user's next track is picked at random on their turn, so the order shown
+    by `queue` is only kept between users
     
     Parameters
     ----------
@@ -618,10 +626,35 @@ async def shuffle(interaction: discord.Interaction):
     """
     player = get_player(interaction)
 
+    # On fair queue the next track is picked at random when dequeuing instead
+    if player.fair_queue:
+        player.set_shuffle(not player.shuffle)
+        if player.shuffle:
+            return await interaction.response.send_message("Turned on shuffling, each user's next track will be picked at random on their turn")
+        return await interaction.response.send_message("Turned off shuffling")
+
     random.shuffle(player.queue)
 
     await interaction.response.send_message("Shuffled queue")
 
+@client.tree.command()
+@app_commands.describe(enabled="Whether to alternate between each user's tracks")
+async def fairqueue(interaction: discord.Interaction, enabled: bool):
+    """Alternates the queue between each user's tracks
+    
+    Parameters
+    ----------
+    interaction : discord.Interaction
+        Discord.py Interaction object
+    enabled : bool
+        Whether to alternate between each user's tracks
+    """
+    player = get_player(interaction)
+
+    player.set_fair_queue(enabled)
+
+    await interaction.response.send_message(f"Turned {'on' if enabled else 'off'} fair queue")
+
 def run() -> None:
     """Starts the bot"""
     client.run(token)
\ No newline at end of file
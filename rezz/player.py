@@ -0,0 +1,261 @@
+"""Custom Lavalink player"""
+
+import heapq
+import random
+
+from lavalink import AudioTrack, DeferredAudioTrack, DefaultPlayer
+
+class _RequesterQueue:
+    """Tracks of a single requester, stored as a list and the index of the next one
+
+    Popping only moves `head` forward, the consumed slots are dropped once they
+    take over half of the list, so appending and popping are O(1) amortized, even
+    shuffled. Inserting anywhere else costs O(n), same as a list, unless the track
+    goes in front and there's a consumed slot left to reuse.
+    """
+    __slots__ = ("tracks", "head")
+
+    def __init__(self) -> None:
+        self.tracks: list[AudioTrack | DeferredAudioTrack] = []
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.tracks) - self.head
+
+    def __iter__(self):
+        return iter(self.tracks[self.head:])
+
+    def insert(self, index: int | None, track: AudioTrack | DeferredAudioTrack) -> None:
+        """Appends the track, or inserts it at `index` relative to the next track
+
+        Negative indexes count from the end, like `list.insert`
+        """
+        if index is None:
+            self.tracks.append(track)
+            return
+
+        if index < 0:
+            index = max(0, len(self) + index)
+
+        if index == 0 and self.head > 0:
+            self.head -= 1
+            self.tracks[self.head] = track
+        else:
+            self.tracks.insert(self.head + index, track)
+
+    def pop(self, shuffle: bool = False) -> AudioTrack | DeferredAudioTrack:
+        """Pops the next track, or a random one by swapping it with the next if `shuffle` is on"""
+        tracks = self.tracks
+        if shuffle:
+            index = random.randrange(self.head, len(tracks))
+            tracks[self.head], tracks[index] = tracks[index], tracks[self.head]
+
+        track = tracks[self.head]
+        tracks[self.head] = None
+        self.head += 1
+
+        if self.head * 2 >= len(tracks):
+            del tracks[:self.head]
+            self.head = 0
+
+        return track
+
+class FairPlayer(DefaultPlayer):
+    """Lavalink player with an optional fair queue mode
+
+    When fair queue is enabled tracks are kept in one queue per requester and
+    the next track is chosen at dequeue time, round-robin between requesters,
+    using a heap of `(turn, seq, requester)` entries. Appending and dequeuing
+    cost O(log r) amortized, r being the amount of requesters with pending tracks,
+    no matter how many tracks are queued.
+
+    Attributes
+    ----------
+    fair_queue : bool
+        Whether the fair queue mode is enabled
+    """
+    def __init__(self, guild_id, node) -> None:
+        self.fair_queue: bool = False
+        self._queue: list[AudioTrack] = []
+        self._requester_queues: dict[int, _RequesterQueue] = {}
+        self._scheduler: list[tuple[int, int, int]] = []
+        self._last_turns: dict[int, int] = {}
+        self._turn = 0
+        self._seq = 0
+
+        super().__init__(guild_id, node)
+
+    @property
+    def queue(self) -> list[AudioTrack] | tuple[AudioTrack, ...]:
+        """Upcoming tracks, in the order they'll be played
+
+        Notes
+        -----
+        On fair queue mode this is a tuple snapshot built from the requester queues,
+        so it can't be changed in place, assigning a new list rebuilds the requester queues.
+        If shuffle is also on, only the order of requesters holds, each one's
+        track is picked at random when it's their turn
+        """
+        if not self.fair_queue:
+            return self._queue
+
+        heap = list(self._scheduler)
+        tracks = {requester: iter(queue) for requester, queue in self._requester_queues.items()}
+        remaining = {requester: len(queue) for requester, queue in self._requester_queues.items()}
+        snapshot = []
+        while heap:
+            turn, seq, requester = heapq.heappop(heap)
+            snapshot.append(next(tracks[requester]))
+            remaining[requester] -= 1
+            if remaining[requester]:
+                heapq.heappush(heap, (turn + 1, seq, requester))
+        return tuple(snapshot)
+
+    @queue.setter
+    def queue(self, value: list[AudioTrack]) -> None:
+        if not self.fair_queue:
+            self._queue = value
+            return
+
+        self._clear_requester_queues()
+        for track in value:
+            self._enqueue(track)
+
+    @property
+    def has_pending(self) -> bool:
+        """Whether there are upcoming tracks, without building the `queue` snapshot"""
+        if not self.fair_queue:
+            return bool(self._queue)
+        # Requesters leave the scheduler as soon as their queue is empty
+        return bool(self._scheduler)
+
+    def set_fair_queue(self, fair_queue: bool) -> None:
+        """Enables or disables the fair queue mode, keeping the pending tracks
+
+        Notes
+        -----
+        Disabling it also turns off shuffling, as `/shuffle` only toggles it on fair queue mode
+
+        Parameters
+        ----------
+        fair_queue : bool
+            Whether to enable fair queue or not
+        """
+        if fair_queue == self.fair_queue:
+            return
+
+        if fair_queue:
+            tracks, self._queue = self._queue, []
+            self.fair_queue = True
+            for track in tracks:
+                self._enqueue(track)
+        else:
+            tracks = list(self.queue)
+            self._clear_requester_queues()
+            self.fair_queue = False
+            self.shuffle = False
+            self._queue = tracks
+
+    def _clear_requester_queues(self) -> None:
+        """Drops every track from the requester queues and the scheduler"""
+        self._requester_queues.clear()
+        self._scheduler.clear()
+        self._last_turns.clear()
+
+    def _schedule(self, requester: int) -> None:
+        """Puts a requester back on the scheduler, taking the turn after the last one they were served"""
+        turn = max(self._turn, self._last_turns.get(requester, -1) + 1)
+        heapq.heappush(self._scheduler, (turn, self._seq, requester))
+        self._seq += 1
+
+    def _enqueue(self, track: AudioTrack | DeferredAudioTrack, index: int | None = None) -> None:
+        """Adds a track to its requester queue, scheduling the requester if needed"""
+        requester_queue = self._requester_queues.setdefault(track.requester, _RequesterQueue())
+        was_empty = not requester_queue
+
+        requester_queue.insert(index, track)
+
+        if was_empty:
+            self._schedule(track.requester)
+
+    def _dequeue(self) -> AudioTrack | DeferredAudioTrack | None:
+        """Pops the next track of the requester whose turn it is
+
+        Notes
+        -----
+        If shuffle is on a random track from that requester's queue is chosen
+        by swapping it with the next one
+        """
+        if not self._scheduler:
+            return None
+
+        turn, seq, requester = heapq.heappop(self._scheduler)
+        requester_queue = self._requester_queues[requester]
+        track = requester_queue.pop(self.shuffle)
+
+        self._turn = turn
+        self._last_turns[requester] = turn
+        if requester_queue:
+            heapq.heappush(self._scheduler, (turn + 1, seq, requester))
+        else:
+            del self._requester_queues[requester]
+            if not self._scheduler:
+                self._last_turns.clear()
+
+        return track
+
+    def add(self, track: AudioTrack | DeferredAudioTrack | dict, requester: int = 0, index: int = None) -> None:
+        """Adds a track to the queue
+
+        Parameters
+        ----------
+        track : lavalink.AudioTrack | lavalink.DeferredAudioTrack | dict
+            The track to add
+        requester : int, optional
+            ID of the user who requested the track, by default 0
+        index : int, optional
+            Index to add the track at, by default appends it.
+            On fair queue mode the index is relative to the requester's own tracks
+        """
+        if not self.fair_queue:
+            return super().add(track, requester, index)
+
+        if isinstance(track, dict):
+            track = AudioTrack(track, requester)
+        if requester != 0:
+            track.requester = requester
+
+        self._enqueue(track, index)
+
+    async def play(self, track: AudioTrack | DeferredAudioTrack | dict | None = None, start_time: int | None = 0,
+                   end_time: int | None = 0, no_replace: bool | None = False, volume: int | None = None,
+                   pause: bool | None = False) -> None:
+        """Plays the given track or the next one from the queue
+
+        Notes
+        -----
+        On fair queue mode looping is handled here, so the current track goes
+        back to its requester queue instead of `queue`
+        """
+        if not self.fair_queue:
+            return await super().play(track, start_time, end_time, no_replace, volume, pause)
+
+        if no_replace and self.is_playing:
+            return
+
+        if self.loop > 0 and self.current:
+            if self.loop == 1:
+                if track is not None:
+                    self._enqueue(self.current, 0)
+                else:
+                    track = self.current
+            if self.loop == 2:
+                self._enqueue(self.current)
+
+        if track is None:
+            track = self._dequeue()
+
+        # Looping was already handled, and with no track the queue is empty so the
+        # default player stops and dispatches QueueEndEvent
+        self.current = None
+        await super().play(track, start_time, end_time, no_replace, volume, pause)
@@ -0,0 +1,186 @@
+"""Tests for the fair queue mode of FairPlayer"""
+
+import asyncio
+from types import SimpleNamespace
+
+import lavalink
+
+from rezz.player import FairPlayer
+
+class FakeNode:
+    """Stands in for a Lavalink node, recording what would be sent to it"""
+    def __init__(self) -> None:
+        self._manager = SimpleNamespace(_lavalink=None)
+        self.sent = []
+        self.events = []
+
+    async def _send(self, **data) -> None:
+        self.sent.append(data)
+
+    async def _dispatch_event(self, event) -> None:
+        self.events.append(event)
+
+def make_track(title: str, requester: int) -> lavalink.AudioTrack:
+    info = {
+        "identifier": title,
+        "isSeekable": True,
+        "author": "author",
+        "length": 1000,
+        "isStream": False,
+        "title": title,
+        "uri": f"https://example.com/{title}"
+    }
+    return lavalink.AudioTrack({"track": title, "info": info}, requester)
+
+def make_player(fair_queue: bool = True) -> FairPlayer:
+    player = FairPlayer(1, FakeNode())
+    player.set_fair_queue(fair_queue)
+    return player
+
+def titles(tracks) -> list[str]:
+    return [track.title for track in tracks]
+
+def drain(player: FairPlayer) -> list[str]:
+    played = []
+    while (track := player._dequeue()) is not None:
+        played.append(track.title)
+    return played
+
+def test_round_robin_with_requester_joining_mid_queue():
+    player = make_player()
+    for i in range(3):
+        player.add(make_track(f"a{i}", 1), requester=1)
+    player.add(make_track("b0", 2), requester=2)
+
+    assert titles(player.queue) == ["a0", "b0", "a1", "a2"]
+    assert player._dequeue().title == "a0"
+
+    player.add(make_track("c0", 3), requester=3)
+
+    assert titles(player.queue) == ["b0", "c0", "a1", "a2"]
+    assert drain(player) == ["b0", "c0", "a1", "a2"]
+    assert not player.has_pending
+
+def test_requester_coming_back_waits_for_their_turn():
+    player = make_player()
+    player.add(make_track("a0", 1), requester=1)
+    for i in range(3):
+        player.add(make_track(f"b{i}", 2), requester=2)
+
+    assert player._dequeue().title == "a0"
+    assert player._dequeue().title == "b0"
+
+    # a0 was already played on this round, so a1 goes after b1
+    player.add(make_track("a1", 1), requester=1)
+
+    assert titles(player.queue) == ["b1", "a1", "b2"]
+    assert drain(player) == ["b1", "a1", "b2"]
+
+def test_loop_track_on_fair_queue():
+    player = make_player()
+    player.add(make_track("a0", 1), requester=1)
+    player.add(make_track("b0", 2), requester=2)
+
+    asyncio.run(player.play())
+    player.set_loop(1)
+    asyncio.run(player.play())
+
+    assert player.current.title == "a0"
+    assert titles(player.queue) == ["b0"]
+
+    # Playing a given track puts the looped one back in front of its requester queue
+    asyncio.run(player.play(make_track("x", 3)))
+
+    assert player.current.title == "x"
+    assert titles(player.queue) == ["b0", "a0"]
+
+def test_loop_queue_on_fair_queue():
+    player = make_player()
+    player.add(make_track("a0", 1), requester=1)
+    player.add(make_track("b0", 2), requester=2)
+    player.set_loop(2)
+
+    played = []
+    for _ in range(4):
+        asyncio.run(player.play())
+        played.append(player.current.title)
+
+    assert played == ["a0", "b0", "a0", "b0"]
+
+def test_queue_end_on_fair_queue():
+    player = make_player()
+    player.add(make_track("a0", 1), requester=1)
+
+    asyncio.run(player.play())
+    asyncio.run(player.play())
+
+    assert player.current is None
+    assert isinstance(player.node.events[-1], lavalink.QueueEndEvent)
+
+def test_switching_fair_queue_keeps_pending_tracks():
+    player = make_player(fair_queue=False)
+    for title, requester in [("a0", 1), ("a1", 1), ("b0", 2), ("a2", 1)]:
+        player.add(make_track(title, requester), requester=requester)
+
+    player.set_fair_queue(True)
+
+    assert titles(player.queue) == ["a0", "b0", "a1", "a2"]
+
+    player.shuffle = True
+    player.set_fair_queue(False)
+
+    assert isinstance(player.queue, list)
+    assert titles(player.queue) == ["a0", "b0", "a1", "a2"]
+    assert not player.shuffle
+
+def test_assigning_queue_on_fair_queue_rebuilds_requester_queues():
+    player = make_player()
+    for title, requester in [("a0", 1), ("a1", 1), ("b0", 2)]:
+        player.add(make_track(title, requester), requester=requester)
+
+    snapshot = player.queue
+    player.queue = [track for track in snapshot if track.title != "a0"]
+
+    assert titles(player.queue) == ["b0", "a1"]
+
+    player.queue = []
+
+    assert player.queue == ()
+    assert not player.has_pending
+
+def test_add_with_index_is_relative_to_requester_tracks():
+    player = make_player()
+    for i in range(4):
+        player.add(make_track(f"a{i}", 1), requester=1)
+    player.add(make_track("b0", 2), requester=2)
+
+    player.add(make_track("front", 1), requester=1, index=0)
+    player.add(make_track("second", 1), requester=1, index=1)
+
+    assert titles(player._requester_queues[1]) == ["front", "second", "a0", "a1", "a2", "a3"]
+
+def test_add_with_negative_index_after_dequeuing():
+    player = make_player()
+    for i in range(6):
+        player.add(make_track(f"a{i}", 1), requester=1)
+    player._dequeue()
+    player._dequeue()
+
+    player.add(make_track("neg", 1), requester=1, index=-1)
+    player.add(make_track("far", 1), requester=1, index=-100)
+
+    assert titles(player._requester_queues[1]) == ["far", "a2", "a3", "a4", "neg", "a5"]
+    assert len(player._requester_queues[1]) == 6
+    assert drain(player) == ["far", "a2", "a3", "a4", "neg", "a5"]
+
+def test_shuffle_plays_every_track_once():
+    player = make_player()
+    for i in range(50):
+        player.add(make_track(f"a{i}", 1), requester=1)
+    player.add(make_track("b0", 2), requester=2)
+    player.set_shuffle(True)
+
+    played = drain(player)
+
+    assert sorted(played) == sorted([f"a{i}" for i in range(50)] + ["b0"])
+    assert played[1] == "b0"